@@ -9,6 +9,7 @@ from importlib import import_module
 import factory
 from django.conf import settings
 from django.core.urlresolvers import reverse
+from mock import patch
 from rest_framework import status
 from rest_framework.test import APITestCase as BaseTestCase
 
@@ -907,6 +908,21 @@ class MembershipCascadeDeletion(APITestCase):
         self.assertEqual(response.status_code, 204)
         self.assertFalse(models.Membership.objects.filter(user=self.user).exists())
 
+    def test_bulk_delete_classroom_membership_cascades(self):
+        url = reverse("kolibri:core:membership-list") + "?user={}&collection={}".format(
+            self.user.id, self.classroom.id
+        )
+        with patch.object(models.Membership, "delete") as delete_mock:
+            response = self.client.delete(url)
+        self.assertEqual(response.status_code, 204)
+        # The filtered memberships are deleted as a queryset, not one by one,
+        # and the pre_delete cascade still removes the learner group membership.
+        delete_mock.assert_not_called()
+        self.assertFalse(models.Membership.objects.filter(user=self.user).exists())
+        self.assertEqual(
+            models.Membership.objects.filter(user=self.other_user).count(), 2
+        )
+
     def test_delete_detail(self):
         response = self.client.delete(
             reverse(
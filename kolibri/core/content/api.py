@@ -1,7 +1,6 @@
 import logging
 import re
 from functools import reduce
-from random import sample
 
 import requests
 from django.core.cache import cache
@@ -94,6 +93,10 @@ def cache_forever(some_func):
     return wrapper_func
 
 
+def get_cache_key(*args, **kwargs):
+    return str(ContentCacheKey.get_cache_key())
+
+
 class ChannelMetadataFilter(FilterSet):
     available = BooleanFilter(method="filter_available", label="Available")
     has_exercise = BooleanFilter(method="filter_has_exercise", label="Has exercises")
@@ -120,6 +123,8 @@ class ChannelMetadataFilter(FilterSet):
 
 
 @method_decorator(cache_forever, name="dispatch")
+@method_decorator(etag(get_cache_key), name="list")
+@method_decorator(etag(get_cache_key), name="retrieve")
 class ChannelMetadataViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = serializers.ChannelMetadataSerializer
     filter_backends = (DjangoFilterBackend,)
@@ -140,17 +145,11 @@ class IdFilter(FilterSet):
 
 
 class ContentNodeFilter(IdFilter):
-    recommendations_for = CharFilter(method="filter_recommendations_for")
-    next_steps = CharFilter(method="filter_next_steps")
-    popular = CharFilter(method="filter_popular")
-    resume = CharFilter(method="filter_resume")
     kind = ChoiceFilter(
         method="filter_kind",
         choices=(content_kinds.choices + (("content", _("Resource")),)),
     )
     user_kind = ChoiceFilter(method="filter_user_kind", choices=user_kinds.choices)
-    in_lesson = CharFilter(method="filter_in_lesson")
-    in_exam = CharFilter(method="filter_in_exam")
     exclude_content_ids = CharFilter(method="filter_exclude_content_ids")
     kind_in = CharFilter(method="filter_kind_in")
 
@@ -162,10 +161,6 @@ class ContentNodeFilter(IdFilter):
             "has_prerequisite",
             "related",
             "exclude_content_ids",
-            "recommendations_for",
-            "next_steps",
-            "popular",
-            "resume",
             "ids",
             "content_id",
             "channel_id",
@@ -237,18 +232,57 @@ class ContentNodeViewset(viewsets.ReadOnlyModelViewSet):
     filter_backends = (DjangoFilterBackend,)
     filter_class = ContentNodeFilter
     pagination_class = OptionalPageNumberPagination
+    # Columns that tree traversal, filtering and progress annotation rely on,
+    # regardless of which fields end up being serialized.
+    required_fields = (
+        "id",
+        "parent",
+        "lang",
+        "content_id",
+        "kind",
+        "tree_id",
+        "lft",
+        "rght",
+        "level",
+    )
 
     def prefetch_related(self, queryset):
         return queryset.prefetch_related(
             "assessmentmetadata", "files", "files__local_file"
         ).select_related("lang")
 
+    def get_only_fields(self):
+        fields = serializers.ContentNodeSerializer.Meta.fields
+        requested = self.request.query_params.get("fields", None)
+        if requested:
+            # Mirror the field filtering done by DynamicFieldsModelSerializer
+            requested = set(requested.split(","))
+            fields = [field for field in fields if field in requested]
+        concrete_fields = set(
+            field.name for field in models.ContentNode._meta.concrete_fields
+        )
+        return set(self.required_fields).union(
+            field for field in fields if field in concrete_fields
+        )
+
     def get_queryset(self, prefetch=True):
-        queryset = models.ContentNode.objects.filter(available=True)
+        queryset = models.ContentNode.objects.filter(available=True).only(
+            *self.get_only_fields()
+        )
         if prefetch:
             return self.prefetch_related(queryset)
         return queryset
 
+    def filter_queryset(self, queryset):
+        # Skip building and validating the filterset entirely when the request
+        # does not use any of its filters, as it would be a no-op.
+        if not any(
+            param in self.filter_class.base_filters
+            for param in self.request.query_params
+        ):
+            return queryset
+        return super(ContentNodeViewset, self).filter_queryset(queryset)
+
     def get_object(self, prefetch=True):
         """
         Returns the object the view is displaying.
@@ -498,10 +532,12 @@ class ContentNodeSlimViewset(ValuesViewset):
         queryset = self.filter_queryset(self.get_queryset())
         pk = kwargs.get("pk", None)
         node = get_object_or_404(queryset, pk=pk)
-        queryset = self.filter_queryset(self.get_queryset())
+        # Filter on the already fetched parent_id directly, rather than combining
+        # with a separate get_siblings queryset.
         queryset = self.prefetch_queryset(
-            queryset
-            & node.get_siblings(include_self=False).exclude(kind=content_kinds.TOPIC)
+            queryset.filter(parent_id=node.parent_id)
+            .exclude(pk=node.pk)
+            .exclude(kind=content_kinds.TOPIC)
         )
         return Response(self.serialize(queryset))
 
@@ -589,19 +625,18 @@ class ContentNodeSlimViewset(ValuesViewset):
 
         queryset = self.prefetch_queryset(self.get_queryset())
 
-        if ContentSessionLog.objects.count() < 50:
+        # Only check whether a 50th session log exists, rather than counting every
+        # session log on the device.
+        if not ContentSessionLog.objects.order_by()[49:50].exists():
             # return 25 random content nodes if not enough session logs
-            pks = queryset.values_list("pk", flat=True).exclude(
-                kind=content_kinds.TOPIC
-            )
-            # .count scales with table size, so can get slow on larger channels
-            count_cache_key = "content_count_for_popular"
-            count = cache.get(count_cache_key) or min(pks.count(), 25)
-            queryset = queryset.filter_by_uuids(
-                sample(list(pks), count), validate=False
-            )
+            candidates = queryset.exclude(kind=content_kinds.TOPIC)
             if not coach_content:
-                queryset = queryset.exclude(coach_content=True)
+                candidates = candidates.exclude(coach_content=True)
+            # let the database do the random sampling in a subquery, rather than
+            # pulling every pk into memory to sample in Python
+            queryset = queryset.filter(
+                pk__in=candidates.order_by("?").values_list("pk", flat=True)[:25]
+            )
         else:
             # get the most accessed content nodes
             # search for content nodes that currently exist in the database
@@ -666,13 +701,15 @@ class ContentNodeSlimViewset(ValuesViewset):
                 .distinct()
             )
 
+            # Only fetch the ten content_ids we need, rather than evaluating
+            # every log for the user just to check whether there are any.
+            content_ids = list(content_ids[:10])
+
             # If no logs, don't bother doing the other queries
             if not content_ids:
                 queryset = queryset.none()
             else:
-                resume = queryset.filter_by_content_ids(
-                    list(content_ids[:10]), validate=False
-                )
+                resume = queryset.filter_by_content_ids(content_ids, validate=False)
                 queryset = resume.dedupe_by_content_id()
 
         return Response(self.serialize(queryset))
@@ -805,10 +842,6 @@ class ContentNodeSearchViewset(ContentNodeSlimViewset):
         )
 
 
-def get_cache_key(*args, **kwargs):
-    return str(ContentCacheKey.get_cache_key())
-
-
 @method_decorator(etag(get_cache_key), name="retrieve")
 class ContentNodeGranularViewset(mixins.RetrieveModelMixin, viewsets.GenericViewSet):
     serializer_class = serializers.ContentNodeGranularSerializer
@@ -887,7 +920,28 @@ class FileViewset(viewsets.ReadOnlyModelViewSet):
     pagination_class = OptionalPageNumberPagination
 
     def get_queryset(self):
-        return models.File.objects.all()
+        return (
+            models.File.objects.all()
+            .select_related("local_file", "contentnode", "lang")
+            .only(
+                "id",
+                "priority",
+                "preset",
+                "supplementary",
+                "thumbnail",
+                "local_file",
+                "local_file__extension",
+                "local_file__file_size",
+                "local_file__available",
+                "contentnode",
+                "contentnode__title",
+                "lang",
+                "lang__lang_code",
+                "lang__lang_subcode",
+                "lang__lang_name",
+                "lang__lang_direction",
+            )
+        )
 
 
 class RemoteChannelViewSet(viewsets.ViewSet):
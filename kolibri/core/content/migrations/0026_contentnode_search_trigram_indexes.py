@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import logging
+
+from django.db import DatabaseError
+from django.db import migrations
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+# The icontains lookup is compiled by Django on Postgres as
+# UPPER("column"::text) LIKE UPPER(%s), so the indexed expressions have to match
+# that exactly for the planner to use them.
+TRIGRAM_INDEXES = (
+    ("content_contentnode_title_trgm", "title"),
+    ("content_contentnode_description_trgm", "description"),
+)
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    try:
+        # Use a savepoint, so that a missing pg_trgm extension or insufficient
+        # privileges to create it does not abort the whole migration.
+        with transaction.atomic(using=schema_editor.connection.alias):
+            schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+            for index_name, column in TRIGRAM_INDEXES:
+                schema_editor.execute(
+                    "CREATE INDEX IF NOT EXISTS {index_name} ON content_contentnode "
+                    "USING gin ((UPPER({column}::text)) gin_trgm_ops)".format(
+                        index_name=index_name, column=column
+                    )
+                )
+    except DatabaseError:
+        logger.warning(
+            "Could not create trigram indexes for content search, "
+            "the pg_trgm extension may not be available"
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for index_name, _ in TRIGRAM_INDEXES:
+        schema_editor.execute("DROP INDEX IF EXISTS {}".format(index_name))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("content", "0025_add_h5p_kind")]
+
+    operations = [migrations.RunPython(create_trigram_indexes, drop_trigram_indexes)]
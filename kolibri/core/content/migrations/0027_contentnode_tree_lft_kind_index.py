@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("content", "0026_contentnode_search_trigram_indexes")]
+
+    operations = [
+        migrations.AlterIndexTogether(
+            name="contentnode",
+            index_together=set(
+                [
+                    ("level", "channel_id", "kind"),
+                    ("level", "channel_id", "available"),
+                    ("tree_id", "lft", "kind"),
+                ]
+            ),
+        )
+    ]
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations
+
+
+def create_available_localfile_index(apps, schema_editor):
+    # Partial indexes are only used here on Postgres, SQLite gets by with the
+    # primary key index.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS content_localfile_available_id "
+        "ON content_localfile (id) WHERE available = true"
+    )
+
+
+def drop_available_localfile_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS content_localfile_available_id")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("content", "0027_contentnode_tree_lft_kind_index")]
+
+    operations = [
+        migrations.AlterIndexTogether(
+            name="file", index_together=set([("local_file", "contentnode")])
+        ),
+        migrations.RunPython(
+            create_available_localfile_index, drop_available_localfile_index
+        ),
+    ]
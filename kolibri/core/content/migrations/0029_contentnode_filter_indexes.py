@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations
+
+# The auto created has_prerequisite through table only has a unique (from, to)
+# index, so add the reverse direction to back the prerequisite_for filter.
+# related is symmetrical, so both directions are already stored as rows.
+PREREQUISITE_TABLE = "content_contentnode_has_prerequisite"
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("content", "0028_unused_files_indexes")]
+
+    operations = [
+        migrations.AlterIndexTogether(
+            name="contentnode",
+            index_together=set(
+                [
+                    ("level", "channel_id", "kind"),
+                    ("level", "channel_id", "available"),
+                    ("tree_id", "lft", "kind"),
+                    ("parent", "lft"),
+                    ("kind", "available"),
+                ]
+            ),
+        ),
+        migrations.RunSQL(
+            [
+                "CREATE INDEX IF NOT EXISTS {table}_to_from ON {table} "
+                "(to_contentnode_id, from_contentnode_id)".format(
+                    table=PREREQUISITE_TABLE
+                )
+            ],
+            ["DROP INDEX IF EXISTS {table}_to_from".format(table=PREREQUISITE_TABLE)],
+        ),
+    ]
@@ -24,12 +24,13 @@ from __future__ import print_function
 
 import os
 from gettext import gettext as _
+from itertools import islice
 
+from concurrent.futures import ThreadPoolExecutor
 from django.core.urlresolvers import reverse
 from django.db import connection
 from django.db import models
 from django.db.models import Min
-from django.db.models import Q
 from django.db.models import QuerySet
 from django.utils.encoding import python_2_unicode_compatible
 from django.utils.text import get_valid_filename
@@ -46,6 +47,8 @@ from kolibri.core.mixins import FilterByUUIDQuerysetMixin
 
 PRESET_LOOKUP = dict(format_presets.choices)
 
+UNKNOWN_PRESET = _("Unknown format")
+
 
 @python_2_unicode_compatible
 class ContentTag(base_models.ContentTag):
@@ -58,12 +61,14 @@ class ContentNodeQueryset(TreeQuerySet, FilterByUUIDQuerysetMixin):
         # remove duplicate content nodes based on content_id
         if connection.vendor == "sqlite":
             # adapted from https://code.djangoproject.com/ticket/22696
+            # The ids come straight from the database, so filter on the subquery
+            # directly rather than going through the UUID validating filter_by_uuids.
             deduped_ids = (
                 self.values("content_id")
                 .annotate(node_id=Min("id"))
-                .values_list("node_id", flat=True)
+                .values("node_id")
             )
-            return self.filter_by_uuids(deduped_ids)
+            return self.filter(id__in=deduped_ids)
 
         # when using postgres, we can call distinct on a specific column
         elif connection.vendor == "postgresql":
@@ -114,6 +119,9 @@ class ContentNode(base_models.ContentNode):
         index_together = [
             ["level", "channel_id", "kind"],
             ["level", "channel_id", "available"],
+            ["tree_id", "lft", "kind"],
+            ["parent", "lft"],
+            ["kind", "available"],
         ]
 
     def __str__(self):
@@ -124,9 +132,13 @@ class ContentNode(base_models.ContentNode):
         Retrieve a queryset of content_ids for non-topic content nodes that are
         descendants of this node.
         """
+        # Clear the tree ordering from the manager, as the order of the ids is irrelevant
         return (
-            ContentNode.objects.filter(lft__gte=self.lft, lft__lte=self.rght)
+            ContentNode.objects.filter(
+                tree_id=self.tree_id, lft__gte=self.lft, lft__lte=self.rght
+            )
             .exclude(kind=content_kinds.TOPIC)
+            .order_by()
             .values_list("content_id", flat=True)
         )
 
@@ -145,6 +157,7 @@ class File(base_models.File):
 
     class Meta:
         ordering = ["priority"]
+        index_together = [["local_file", "contentnode"]]
 
     class Admin:
         pass
@@ -162,7 +175,7 @@ class File(base_models.File):
         """
         Return the preset.
         """
-        return PRESET_LOOKUP.get(self.preset, _("Unknown format"))
+        return PRESET_LOOKUP.get(self.preset, UNKNOWN_PRESET)
 
     def get_download_filename(self):
         """
@@ -187,15 +200,37 @@ class File(base_models.File):
         )
 
 
+DELETE_FILES_MAX_WORKERS = 8
+
+DELETE_FILES_BATCH_SIZE = 500
+
+
+def _remove_stored_file(file):
+    try:
+        os.remove(paths.get_content_storage_file_path(file.get_filename()))
+        return True
+    except (IOError, OSError, InvalidStorageFilenameError):
+        return False
+
+
 class LocalFileQueryset(models.QuerySet, FilterByUUIDQuerysetMixin):
     def delete_unused_files(self):
-        for file in self.get_unused_files():
-            try:
-                os.remove(paths.get_content_storage_file_path(file.get_filename()))
-                yield True, file
-            except (IOError, OSError, InvalidStorageFilenameError):
-                yield False, file
-        self.get_unused_files().update(available=False)
+        # Stream the unused files rather than caching them all on the queryset,
+        # and keep track of their ids so that the unused files query only runs once.
+        unused_ids = []
+        files = self.get_unused_files().iterator()
+        # Removing files is IO bound, so remove each batch concurrently in threads.
+        with ThreadPoolExecutor(max_workers=DELETE_FILES_MAX_WORKERS) as executor:
+            while True:
+                batch = list(islice(files, DELETE_FILES_BATCH_SIZE))
+                if not batch:
+                    break
+                unused_ids.extend(file.id for file in batch)
+                for deleted, file in zip(
+                    executor.map(_remove_stored_file, batch), batch
+                ):
+                    yield deleted, file
+        self.filter_by_uuids(unused_ids, validate=False).update(available=False)
 
     def get_orphan_files(self):
         return self.filter(files__isnull=True)
@@ -204,9 +239,9 @@ class LocalFileQueryset(models.QuerySet, FilterByUUIDQuerysetMixin):
         return self.filter(files__isnull=True).delete()
 
     def get_unused_files(self):
-        return self.filter(
-            ~Q(files__contentnode__available=True) | Q(files__isnull=True)
-        ).filter(available=True)
+        # Excluding across the multi-valued relation compiles to a single NOT IN
+        # subquery, which also matches local files that have no file objects at all.
+        return self.filter(available=True).exclude(files__contentnode__available=True)
 
 
 @python_2_unicode_compatible
@@ -8,6 +8,7 @@ import mock
 import requests
 from django.core.cache import cache
 from django.core.urlresolvers import reverse
+from django.db import connection
 from django.test import TestCase
 from django.utils import timezone
 from le_utils.constants import content_kinds
@@ -19,10 +20,12 @@ from kolibri.core.auth.models import Facility
 from kolibri.core.auth.models import FacilityUser
 from kolibri.core.auth.test.helpers import provision_device
 from kolibri.core.content import models as content
+from kolibri.core.device.models import ContentCacheKey
 from kolibri.core.device.models import DevicePermissions
 from kolibri.core.device.models import DeviceSettings
 from kolibri.core.logger.models import ContentSessionLog
 from kolibri.core.logger.models import ContentSummaryLog
+from kolibri.core.mixins import UUIDIn
 
 DUMMY_PASSWORD = "password"
 
@@ -196,6 +199,49 @@ class ContentNodeQuerysetTestCase(TestCase):
             content.ContentNode.objects.filter_by_uuids(content_ids).count(), 0
         )
 
+    def test_filter_uuid_trailing_newline(self):
+        content_ids = list(content.ContentNode.objects.values_list("id", flat=True))
+        content_ids[0] = content_ids[0] + "\n"
+        self.assertEqual(
+            content.ContentNode.objects.filter_by_uuids(content_ids).count(), 0
+        )
+
+    def test_filter_uuid_empty(self):
+        self.assertEqual(content.ContentNode.objects.filter_by_uuids([]).count(), 0)
+        self.assertEqual(
+            content.ContentNode.objects.exclude_by_uuids([]).count(),
+            content.ContentNode.objects.count(),
+        )
+
+    def test_filter_uuid_postgres_values_list(self):
+        class PostgresConnection(object):
+            vendor = "postgresql"
+            alias = connection.alias
+            ops = connection.ops
+            data_types = {"UUIDField": "uuid"}
+
+        node_id = content.ContentNode.objects.first().id
+        lookup = UUIDIn(
+            content.ContentNode._meta.pk.get_col(content.ContentNode._meta.db_table),
+            [node_id],
+        )
+        compiler = content.ContentNode.objects.all().query.get_compiler(
+            connection=connection
+        )
+        self.assertEqual(
+            lookup.process_rhs(compiler, PostgresConnection()),
+            ("(VALUES ('{}'::uuid))".format(node_id), ()),
+        )
+
+    def test_get_descendant_content_ids(self):
+        root = content.ContentNode.objects.get(title="root")
+        expected = set(
+            root.get_descendants()
+            .exclude(kind=content_kinds.TOPIC)
+            .values_list("content_id", flat=True)
+        )
+        self.assertSetEqual(set(root.get_descendant_content_ids()), expected)
+
 
 class ContentNodeAPITestCase(APITestCase):
     """
@@ -725,6 +771,21 @@ class ContentNodeAPITestCase(APITestCase):
         )
         self.assertEqual(len(response.data), 2)
 
+    def test_contentnode_slim_recommendations_siblings(self):
+        node = content.ContentNode.objects.get(title="c1")
+        response = self.client.get(
+            reverse(
+                "kolibri:core:contentnode_slim-recommendations-for",
+                kwargs={"pk": node.id},
+            )
+        )
+        expected = content.ContentNode.objects.get(title="copy", parent=node.parent)
+        topic_sibling = content.ContentNode.objects.get(title="c2")
+        response_ids = [item["id"] for item in response.data]
+        self.assertEqual(response_ids, [expected.id])
+        self.assertNotIn(node.id, response_ids)
+        self.assertNotIn(topic_sibling.id, response_ids)
+
     def test_contentnode_slim_recommendations_does_error_for_unavailable_node(self):
         node = content.ContentNode.objects.get(title="c2c2")
         node.available = False
@@ -815,6 +876,26 @@ class ContentNodeAPITestCase(APITestCase):
         )
         self.assertEqual(response.data["name"], "testing")
 
+    def test_channelmetadata_list_not_modified(self):
+        ContentCacheKey.update_cache_key()
+        response = self.client.get(reverse("kolibri:core:channel-list"))
+        etag = response["ETag"]
+        response = self.client.get(
+            reverse("kolibri:core:channel-list"), HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 304)
+
+    def test_channelmetadata_list_etag_changes_with_content_cache_key(self):
+        # Store a stale key, so that updating it always changes the ETag
+        ContentCacheKey(key=1).save()
+        response = self.client.get(reverse("kolibri:core:channel-list"))
+        etag = response["ETag"]
+        ContentCacheKey.update_cache_key()
+        response = self.client.get(
+            reverse("kolibri:core:channel-list"), HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 200)
+
     def test_channelmetadata_langfield(self):
         data = content.ChannelMetadata.objects.first()
         root_lang = content.Language.objects.get(pk=1)
@@ -1193,6 +1274,17 @@ class ContentNodeAPITestCase(APITestCase):
         response = self.client.get(reverse("kolibri:core:contentnode_slim-popular"))
         self.assertEqual(response["Cache-Control"], "max-age=600")
 
+    def test_popular_random_without_session_logs(self):
+        expected_ids = set(
+            content.ContentNode.objects.filter(available=True, coach_content=False)
+            .exclude(kind=content_kinds.TOPIC)
+            .values_list("id", flat=True)
+        )
+        response = self.client.get(reverse("kolibri:core:contentnode_slim-popular"))
+        response_ids = set(node["id"] for node in response.json())
+        self.assertTrue(0 < len(response_ids) <= 25)
+        self.assertTrue(response_ids.issubset(expected_ids))
+
     def _create_summary_logs(self):
         facility = Facility.objects.create(name="MyFac")
         user = FacilityUser.objects.create(username="user", facility=facility)
@@ -56,15 +56,17 @@ class UnavailableContentDeletion(TransactionTestCase):
         self.file.save()
 
         # actually store a dummy local file
-        self.filename = "{}.{}".format(self.hash, self.extension)
+        self.path = self.store_local_file(self.stored_local_file)
 
-        self.path = get_content_storage_file_path(self.filename)
-        path_dir = os.path.dirname(self.path)
+    def store_local_file(self, local_file):
+        path = get_content_storage_file_path(local_file.get_filename())
+        path_dir = os.path.dirname(path)
         if not os.path.exists(path_dir):
             os.makedirs(path_dir)
-        tempfile = open(self.path, "w")
+        tempfile = open(path, "w")
         tempfile.write("wow")
         tempfile.close()
+        return path
 
     def delete_content(self):
         num_deleted = 0
@@ -102,6 +104,48 @@ class UnavailableContentDeletion(TransactionTestCase):
         deleted, freed_bytes = self.delete_content()
         self.assertEqual(deleted, 0)
 
+    def test_delete_stored_files_without_file_objects(self):
+        orphan_local_file = LocalFile.objects.create(
+            id=hashlib.md5("orphan".encode()).hexdigest(),
+            extension=self.extension,
+            available=True,
+            file_size=1000,
+        )
+        orphan_path = self.store_local_file(orphan_local_file)
+        unused_ids = LocalFile.objects.get_unused_files().values_list("id", flat=True)
+        self.assertIn(orphan_local_file.id, unused_ids)
+        deleted, freed_bytes = self.delete_content()
+        self.assertEqual(deleted, 2)
+        self.assertEqual(
+            freed_bytes, self.stored_local_file.file_size + orphan_local_file.file_size
+        )
+
+        self.assertEqual(os.path.exists(orphan_path), False)
+        orphan_local_file.refresh_from_db()
+        self.assertFalse(orphan_local_file.available)
+
+    def test_unused_files_with_multiple_file_objects_not_duplicated(self):
+        other_unavailable_contentnode = ContentNode.objects.create(
+            title="wow",
+            available=False,
+            id=uuid.uuid4().hex,
+            content_id=uuid.uuid4().hex,
+            channel_id=uuid.uuid4().hex,
+        )
+        File.objects.create(
+            local_file=self.stored_local_file,
+            contentnode=other_unavailable_contentnode,
+            preset=format_presets.DOCUMENT,
+            id=uuid.uuid4().hex,
+        )
+        self.assertEqual(
+            list(LocalFile.objects.get_unused_files().values_list("id", flat=True)),
+            [self.stored_local_file.id],
+        )
+        deleted, freed_bytes = self.delete_content()
+        self.assertEqual(deleted, 1)
+        self.assertEqual(freed_bytes, self.stored_local_file.file_size)
+
     def tearDown(self):
         call_command("flush", interactive=False)
         super(UnavailableContentDeletion, self).tearDown()
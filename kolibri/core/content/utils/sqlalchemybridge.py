@@ -346,13 +346,15 @@ def exclude_by_uuids(field, ids, validate=True):
     return _by_uuids(field, ids, validate, False)
 
 
-def _format_uuid(identifier):
+def _get_uuids_string(ids):
+    if django_connection.vendor == "postgresql":
+        # render the uuids as rows of a VALUES list, which can be hash joined against
+        return "VALUES " + ",".join(
+            "('{}'::uuid)".format(identifier) for identifier in ids
+        )
     # wrap the uuids in string quotations
-    if django_connection.vendor == "sqlite":
-        return "'{}'".format(identifier)
-    elif django_connection.vendor == "postgresql":
-        return "'{}'::uuid".format(identifier)
-    return identifier
+    uuid_format = "'{}'" if django_connection.vendor == "sqlite" else "{}"
+    return ",".join(uuid_format.format(identifier) for identifier in ids)
 
 
 def _by_uuids(field, ids, validate, include):
@@ -362,9 +364,9 @@ def _by_uuids(field, ids, validate, include):
     if ids:
         try:
             validate_uuids(ids)
-            ids_list = [_format_uuid(identifier) for identifier in ids]
+            ids_string = _get_uuids_string(ids)
             return UnaryExpression(
-                field, modifier=operators.custom_op(query + ",".join(ids_list) + ")")
+                field, modifier=operators.custom_op(query + ids_string + ")")
             )
         except UUIDValidationError:
             # the value is not a valid hex code for a UUID, so fall through to the
@@ -1,6 +1,7 @@
 """
 Mixins for Django REST Framework ViewSets
 """
+import re
 from uuid import UUID
 
 from django.core.exceptions import EmptyResultSet
@@ -11,6 +12,8 @@ from django.db.models.lookups import In
 from morango.models import UUIDField
 from rest_framework import status
 from rest_framework.response import Response
+from six import get_unbound_function
+from six import string_types
 
 
 class BulkCreateMixin(object):
@@ -51,8 +54,15 @@ class BulkDeleteMixin(object):
         instance.delete()
 
     def perform_bulk_destroy(self, objects):
-        for obj in objects:
-            self.perform_destroy(obj)
+        perform_destroy = get_unbound_function(type(self).perform_destroy)
+        if perform_destroy is not get_unbound_function(BulkDeleteMixin.perform_destroy):
+            # Respect any customized destroy behaviour for individual objects
+            for obj in objects:
+                self.perform_destroy(obj)
+        else:
+            # Deleting the queryset still collects cascades and sends the delete
+            # signals for each object, but does the deletion in bulk queries.
+            objects.delete()
 
 
 class UUIDIn(In):
@@ -81,7 +91,21 @@ class UUIDIn(In):
             # rhs should be an iterable; use batch_process_rhs() to
             # prepare/transform those values.
             sqls, sqls_params = self.batch_process_rhs(compiler, connection, rhs)
-            placeholder = "(" + ",".join("'{}'".format(p) for p in sqls_params) + ")"
+            if (
+                connection.vendor == "postgresql"
+                and self.lhs.output_field.db_type(connection) == "uuid"
+            ):
+                # Postgres can hash join against a VALUES list, rather than
+                # checking each row against a long list of individually cast values.
+                placeholder = (
+                    "(VALUES "
+                    + ",".join("('{}'::uuid)".format(p) for p in sqls_params)
+                    + ")"
+                )
+            else:
+                placeholder = (
+                    "(" + ",".join("'{}'".format(p) for p in sqls_params) + ")"
+                )
             sqls_params = tuple()
             return (placeholder, sqls_params)
         else:
@@ -125,12 +149,23 @@ class UUIDValidationError(Exception):
     pass
 
 
+# Matches the hex representation of a UUID, with or without hyphens.
+# Anchored with \Z rather than $ so that a trailing newline is rejected.
+UUID_REGEX = re.compile(
+    r"^[0-9a-f]{8}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{12}\Z",
+    re.IGNORECASE,
+)
+
+
+def _is_valid_uuid(identifier):
+    if isinstance(identifier, UUID):
+        return True
+    return isinstance(identifier, string_types) and bool(UUID_REGEX.match(identifier))
+
+
 def validate_uuids(ids):
     for identifier in ids:
-        try:
-            if not isinstance(identifier, UUID):
-                UUID(identifier, version=4)
-        except (TypeError, ValueError):
+        if not _is_valid_uuid(identifier):
             # the value is not a valid hex code for a UUID, so we don't return any results
             raise UUIDValidationError(
                 "{} did not pass UUID validation".format(identifier)
@@ -158,6 +193,9 @@ class FilterByUUIDQuerysetMixin(object):
             # on the queryset itself.
             lookup = "in"
         else:
+            if not ids:
+                # Nothing to match against, so avoid building an empty IN clause
+                return self.none() if include else self.all()
             if validate:
                 try:
                     validate_uuids(ids)
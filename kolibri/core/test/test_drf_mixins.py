@@ -6,6 +6,7 @@ import json
 from django.test import TestCase
 from django.test.client import RequestFactory
 from django_filters.rest_framework import DjangoFilterBackend
+from mock import patch
 from rest_framework import status
 from rest_framework.viewsets import ModelViewSet
 
@@ -26,6 +27,14 @@ class BulkDeleteView(BulkDeleteMixin, LanguageViewSet):
     pass
 
 
+class BulkDeleteCustomDestroyView(BulkDeleteMixin, LanguageViewSet):
+    destroyed = None
+
+    def perform_destroy(self, instance):
+        self.destroyed.append(instance.id)
+        instance.delete()
+
+
 class BulkCreateView(BulkCreateMixin, LanguageViewSet):
     pass
 
@@ -107,3 +116,33 @@ class TestBulkAPIMixins(TestCase):
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         self.assertEqual(Language.objects.count(), 1)
         self.assertEqual(Language.objects.get().id, self.lang2["id"])
+
+    def test_delete_filtered_deletes_queryset(self):
+        """
+        Test that DELETE removes the filtered resources without deleting each object.
+        """
+        view = BulkDeleteView.as_view({"delete": "bulk_destroy"})
+        Language.objects.create(**self.lang1)
+        Language.objects.create(**self.lang2)
+
+        with patch.object(Language, "delete") as delete_mock:
+            response = view(self.request.delete("?id=" + self.lang1["id"]))
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        delete_mock.assert_not_called()
+        self.assertEqual(Language.objects.get().id, self.lang2["id"])
+
+    def test_delete_filtered_custom_perform_destroy(self):
+        """
+        Test that DELETE uses a customized perform_destroy for each filtered resource.
+        """
+        view = BulkDeleteCustomDestroyView.as_view({"delete": "bulk_destroy"})
+        Language.objects.create(**self.lang1)
+        Language.objects.create(**self.lang2)
+
+        with patch.object(BulkDeleteCustomDestroyView, "destroyed", []) as destroyed:
+            response = view(self.request.delete("?id=" + self.lang1["id"]))
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(destroyed, [self.lang1["id"]])
+        self.assertEqual(Language.objects.get().id, self.lang2["id"])